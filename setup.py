@@ -32,6 +32,7 @@ setup(
         "python-slugify>=8.0.0",
         "httpx>=0.25.0",
         "aiohttp>=3.8.0",
+        "orjson>=3.9.0",
         "pydantic>=2.0.0",
         "rich>=13.0.0",
         "typing-extensions>=4.8.0",
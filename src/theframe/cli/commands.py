@@ -1,11 +1,12 @@
 """CLI commands for TheFrame application."""
 
-import json
+import asyncio
 import os
 from pathlib import Path
 from typing import Any, Optional
 
-import requests
+import httpx
+import orjson
 from slugify import slugify
 
 from ..core.exceptions import ConfigurationError, TVConnectionError
@@ -25,59 +26,57 @@ class UploadCommand(BaseCommand):
 
     async def execute(self, embed: bool = False, test: bool = False) -> None:
         """Execute upload command."""
-        # Load artwork collection
-        metadata_service = MetadataService()
-        collection = metadata_service.load_collection_from_json(self.settings.artworks_json)
-
-        if collection.count() == 0:
-            raise ConfigurationError("No artworks found in collection")
-
         # Get random artwork
-        artwork = metadata_service.get_random_artwork(collection)
+        metadata_service = MetadataService()
+        artwork = metadata_service.load_random_artwork(self.settings.artworks_json)
         if not artwork:
-            raise ConfigurationError("Failed to select random artwork")
+            raise ConfigurationError("No artworks found in collection")
 
         self.logger.info(f"Selected: {artwork.display_name}")
 
-        # Process image
-        image_processor = ImageProcessor()
-        image_data = await image_processor.process_artwork_image(
-            artwork, embed_metadata=embed, resize=True
-        )
-
-        if test:
-            # Save test image instead of uploading
-            test_path = Path("test.jpg")
-            await image_processor.save_image(image_data, test_path)
-            self.logger.info(f"Test image saved as {test_path}")
-        else:
-            # Upload to TV
+        # Probe the TV in a worker thread while the image is being prepared
+        if not test:
             tv_device = TVDevice(ip=self.settings.tv_ip, token=self.settings.tv_token)
             tv_service = TVService(tv_device)
+            tv_online = asyncio.create_task(asyncio.to_thread(tv_service.test_connection))
 
-            filename = artwork.safe_filename
-            success = tv_service.upload_image(image_data, filename)
+        # Process image
+        async with ImageProcessor() as image_processor:
+            image_data = await image_processor.process_artwork_image(
+                artwork, embed_metadata=embed, resize=True
+            )
 
-            if success:
-                self.logger.info(f"Successfully uploaded {filename} to TV")
+            if test:
+                # Save test image instead of uploading
+                test_path = Path("test.jpg")
+                await image_processor.save_image(image_data, test_path)
+                self.logger.info(f"Test image saved as {test_path}")
             else:
-                raise TVConnectionError("Upload failed")
+                if not await tv_online:
+                    raise TVConnectionError("Cannot connect to TV")
+
+                # Upload to TV, keeping the blocking websocket calls off the loop
+                filename = artwork.safe_filename
+                success = await asyncio.to_thread(
+                    tv_service.upload_image, image_data, filename, check_connection=False
+                )
+
+                if success:
+                    self.logger.info(f"Successfully uploaded {filename} to TV")
+                else:
+                    raise TVConnectionError("Upload failed")
 
 class PopulateCommand(BaseCommand):
     """Populate artwork metadata with AI enhancement."""
 
-    def get_artwork_info(self, author_title: str) -> dict | None:
+    async def get_artwork_info(
+        self, client: httpx.AsyncClient, url: str, author_title: str
+    ) -> dict | None:
         """
         Dado un pintor y el nombre (aproximado) de una obra,
         devuelve información estructurada en formato JSON.
         """
 
-        url = os.getenv("AI_BASE_URL")
-        headers = {
-            "Authorization": f"Bearer {os.getenv('AI_API_KEY')}",
-            "Content-Type": "application/json"
-        }
-
         payload = {
             "model": "sonar-pro",
             "messages": [
@@ -117,7 +116,11 @@ class PopulateCommand(BaseCommand):
             ]
         }
 
-        response = requests.post(url, headers=headers, json=payload)
+        try:
+            response = await client.post(url, json=payload)
+        except httpx.HTTPError as e:
+            print("⚠️ Error al llamar a la API:", e)
+            return None
 
         try:
             r = response.json()
@@ -132,8 +135,8 @@ class PopulateCommand(BaseCommand):
             return None
 
         try:
-            return json.loads(content)
-        except json.JSONDecodeError:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
             print("⚠️ El modelo devolvió algo que no es JSON válido:")
             print(content)
             return None
@@ -157,31 +160,59 @@ class PopulateCommand(BaseCommand):
         metadata_service = MetadataService()
 
         # Load existing collection
-        source = json.loads(Path(self.settings.source_json).read_text(encoding="utf-8"))
-        a = source.pop(0)
-        author_title = a.get("name")
+        source = orjson.loads(Path(self.settings.source_json).read_bytes())
+        pending = source[:self.settings.batch_size]
+        remaining = source[len(pending):]
 
-        result = self.get_artwork_info(author_title)
-        number = self.next_number("json")
-
-        if not result:
-            print("⚠️ No se recibieron datos:", result)
-            return None
-
-        result["number"] = number
-        author_title = result.get("author") + " - " + result.get("title")
-
-        filename = os.path.join(
-            "./json",
-            str(number).zfill(4) + "-" + slugify(author_title) + ".json"
-        )
+        # Endpoint and auth headers are the same for every request
+        url = os.getenv("AI_BASE_URL")
+        headers = {
+            "Authorization": f"Bearer {os.getenv('AI_API_KEY')}",
+            "Content-Type": "application/json"
+        }
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
-            print(f"Guardado en {filename}")
+        # Query the API for the whole batch concurrently
+        async with httpx.AsyncClient(timeout=120, headers=headers) as client:
+            results = await asyncio.gather(
+                *(self.get_artwork_info(client, url, a.get("name")) for a in pending)
+            )
 
-        with open(self.settings.source_json, 'w', encoding='utf-8') as fp:
-            json.dump(source, fp, ensure_ascii=False, indent=2)
+        # Number the results in source order so numbering stays deterministic
+        number = self.next_number("json")
+        failed = []
+        handled = 0
+        try:
+            for a, result in zip(pending, results):
+                if not (
+                    isinstance(result, dict)
+                    and isinstance(result.get("author"), str)
+                    and isinstance(result.get("title"), str)
+                ):
+                    print("⚠️ No se recibieron datos válidos:", a.get("name"))
+                    failed.append(a)
+                    handled += 1
+                    continue
+
+                result["number"] = number
+                author_title = result["author"] + " - " + result["title"]
+
+                filename = os.path.join(
+                    "./json",
+                    str(number).zfill(4) + "-" + slugify(author_title) + ".json"
+                )
+
+                Path(filename).write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+                print(f"Guardado en {filename}")
+
+                number += 1
+                handled += 1
+        finally:
+            # Always drop the entries already written, even if the loop fails
+            # midway; failed ones go to the front of the queue for the next run
+            queue = failed + pending[handled:] + remaining
+            Path(self.settings.source_json).write_bytes(
+                orjson.dumps(queue, option=orjson.OPT_INDENT_2)
+            )
 
 class ErrorsCommand(BaseCommand):
     """Check for errors in artwork metadata."""
@@ -201,15 +232,13 @@ class ErrorsCommand(BaseCommand):
         # Load collection
         collection = metadata_service.load_collection_from_json(self.settings.artworks_json)
 
-        # Find duplicates
-        duplicates = metadata_service.find_duplicates(collection)
+        # Validate collection and find duplicates
+        issues, duplicates = metadata_service.scan(collection)
         if duplicates:
             self.logger.error("Found duplicate artworks:")
             for artwork in duplicates:
                 self.logger.error(f"{artwork.display_name}")
 
-        # Validate collection
-        issues = metadata_service.validate_collection(collection)
         if issues:
             for issue in issues:
                 self.logger.error(f"{issue}")
@@ -241,15 +270,12 @@ class GenerateJsonCommand(BaseCommand):
         metadata_service = MetadataService()
 
         json_path = Path(__file__).parent / ".." / ".." / ".." / "json"
+        output_path = Path(self.settings.artworks_json)
+        sources = sorted(json_path.glob("*.json"))
 
-        artworks = {}
-        for f in sorted(json_path.glob("*.json")):
-            with open(f, "r", encoding="utf-8") as json_file:
-                data = json.load(json_file)
-                artworks[f.name] = data
-
-        with open(os.getenv("THEFRAME_ARTWORKS_JSON"), "w", encoding="utf-8") as json_file:
-            json.dump(artworks, json_file, ensure_ascii=False, indent=2)
+        # orjson parses straight from bytes and encodes UTF-8 output directly
+        artworks = {f.name: orjson.loads(f.read_bytes()) for f in sources}
+        output_path.write_bytes(orjson.dumps(artworks, option=orjson.OPT_INDENT_2))
 
         self.logger.info(f"Generated JSON file at {json_path}")
 
@@ -1,5 +1,6 @@
 """Core domain models for TheFrame application."""
 
+import functools
 import os
 from datetime import datetime
 from pathlib import Path
@@ -8,9 +9,20 @@ from urllib.parse import urlparse
 
 import requests
 from pydantic import BaseModel, Field, validator
+from requests.adapters import HTTPAdapter
 from slugify import slugify
 
 
+@functools.lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    """Get the pooled session for URL probes, created on first use."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=2)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 class ArtworkTranslation(BaseModel):
     author: Optional[str] = None
     title: Optional[str] = None
@@ -61,7 +73,7 @@ class Artwork(BaseModel):
         url = f"{base_url}/{self.filename}"
 
         try:
-            response = requests.head(url, allow_redirects=True, timeout=10)
+            response = _http_session().head(url, allow_redirects=True, timeout=10)
             result: bool = response.status_code == 200
             return result
         except requests.RequestException as e:
@@ -151,7 +163,11 @@ class ArtworkCollection(BaseModel):
         if not self.artworks:
             return None
         import random
-        return random.choice(list(self.artworks.values()))
+        from itertools import islice
+
+        # Skip to a random position instead of copying all values to a list
+        index = random.randrange(len(self.artworks))
+        return next(islice(self.artworks.values(), index, None))
 
     def count(self) -> int:
         """Get number of artworks in collection."""
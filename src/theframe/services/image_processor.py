@@ -1,15 +1,139 @@
 """Image processing service for TheFrame application."""
 
+import functools
 import io
 import logging
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Any, Optional, Tuple, Union
 
 import aiohttp
 from PIL import Image, ImageDraw, ImageFilter, ImageFont
 
 from ..core.exceptions import ImageProcessingError
-from ..core.models import Artwork, ArtworkMetadata
+from ..core.models import Artwork, ArtworkMetadata, ArtworkTranslation
+
+# Font candidates, in order of preference
+_FONT_PATHS = [
+    "/System/Library/Fonts/Supplemental/Arial Bold.ttf",  # macOS
+    "/usr/share/fonts/TTF/DejaVuSans-Bold.ttf",  # Linux
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",  # Debian/Ubuntu
+    "arialbd.ttf",  # Windows
+]
+
+# Probed once at import; None falls back to Pillow's default font
+_FONT_PATH: Optional[str] = next((p for p in _FONT_PATHS if Path(p).exists()), None)
+
+
+@functools.lru_cache(maxsize=4)
+def _read_font_bytes(path: str) -> bytes:
+    """Read a font file once and keep its contents in memory."""
+    return Path(path).read_bytes()
+
+
+@functools.lru_cache(maxsize=64)
+def _get_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font, reusing already parsed faces."""
+    return ImageFont.truetype(io.BytesIO(_read_font_bytes(path)), size)
+
+
+@functools.lru_cache(maxsize=256)
+def _text_size(
+    text: str, font: Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]
+) -> Tuple[int, int]:
+    """Measure a line as (advance width, line height) in the given font.
+
+    Uses a single layout pass plus the font's line metrics, with no glyph
+    bounding boxes. Bitmap fonts have no metrics, so their height comes
+    from the text's bounding box. Fonts come from the _get_font cache, so
+    repeated lines hit this cache as well.
+    """
+    if isinstance(font, ImageFont.FreeTypeFont):
+        ascent, descent = font.getmetrics()
+        height = ascent + descent
+    else:
+        bbox = font.getbbox(text)
+        height = int(bbox[3] - bbox[1])
+    return int(font.getlength(text)), height
+
+
+# Metadata box padding and spacing
+_PADDING_X = 40
+_PADDING_Y = 35
+_SPACING = 15
+_DIVIDER_HEIGHT = 2
+_LINE_SPACE = 25
+_MARGIN_X, _MARGIN_Y = 50, 50
+
+
+def _box_layout(
+    width: int, height: int, text_sizes: Tuple[Tuple[int, int], ...]
+) -> Tuple[int, int, int, int]:
+    """Compute the metadata box as (x0, y0, width, height) for an image.
+
+    The box sits at the bottom left with margins, clamped to the image
+    bounds.
+    """
+    (text_w1, text_h1), (text_w2, text_h2), (text_w3, text_h3) = text_sizes
+
+    box_width = max(text_w1, text_w2, text_w3) + 2 * _PADDING_X
+    box_height = (
+        text_h1
+        + 2
+        + text_h2
+        + _DIVIDER_HEIGHT
+        + text_h3
+        + 2 * _PADDING_Y
+        + 2 * _SPACING
+        + _LINE_SPACE
+    )
+
+    # Position box at bottom left with margins, within image bounds
+    box_x0 = max(0, min(_MARGIN_X, width - box_width))
+    box_y0 = max(0, min(height - box_height - _MARGIN_Y, height - box_height))
+    return box_x0, box_y0, box_width, box_height
+
+
+# Soft drop shadow behind the metadata box
+_SHADOW_OFFSET = 10
+_SHADOW_BLUR = 10
+_SHADOW_PAD = 2 * _SHADOW_BLUR
+
+
+@functools.lru_cache(maxsize=32)
+def _shadow_mask(box_width: int, box_height: int) -> Image.Image:
+    """Build the blurred alpha mask for a box's shadow.
+
+    The mask is padded by ``_SHADOW_PAD`` on each side to leave room for
+    the blur. Boxes of the same size share one mask; callers must not
+    modify it.
+    """
+    mask = Image.new(
+        "L", (box_width + 2 * _SHADOW_PAD, box_height + 2 * _SHADOW_PAD), 0
+    )
+    ImageDraw.Draw(mask).rectangle(
+        [_SHADOW_PAD, _SHADOW_PAD, _SHADOW_PAD + box_width, _SHADOW_PAD + box_height],
+        fill=180,
+    )
+    return mask.filter(ImageFilter.GaussianBlur(radius=_SHADOW_BLUR))
+
+
+def _encode_jpeg(image: Image.Image, quality: int = 95) -> bytes:
+    """Encode an image as JPEG bytes.
+
+    Pillow's wheels ship libjpeg-turbo, so this already uses its SIMD
+    encoder; keep every JPEG write going through here. Chroma is 4:2:0
+    and the extra Huffman optimisation and progressive passes are off.
+    """
+    output = io.BytesIO()
+    image.save(
+        output,
+        format='JPEG',
+        quality=quality,
+        subsampling=2,
+        optimize=False,
+        progressive=False,
+    )
+    return output.getvalue()
 
 
 class ImageProcessor:
@@ -17,30 +141,46 @@ class ImageProcessor:
 
     def __init__(self, font_path: Optional[str] = None):
         # Load font with fallbacks
-        font_paths = [
-            "/System/Library/Fonts/Supplemental/Arial Bold.ttf",  # macOS
-            "/usr/share/fonts/TTF/DejaVuSans-Bold.ttf",  # Linux
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",  # Debian/Ubuntu
-            "arialbd.ttf",  # Windows
-        ]
         if font_path and Path(font_path).exists():
             self.font_path = font_path
         else:
-            self.font_path = next((p for p in font_paths if Path(p).exists()), None)
+            self.font_path = _FONT_PATH
         self.logger = logging.getLogger(__name__)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "ImageProcessor":
+        """Enter the processor context; the session is opened lazily."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the pooled HTTP session."""
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the pooled HTTP session."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     async def download_image(self, url: str) -> bytes:
         """Download image from URL asynchronously."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        return await response.read()
-                    else:
-                        raise ImageProcessingError(
-                            f"Failed to download image from {url}",
-                            f"HTTP {response.status}"
-                        )
+            async with self._get_session().get(url) as response:
+                if response.status == 200:
+                    return await response.read()
+                else:
+                    raise ImageProcessingError(
+                        f"Failed to download image from {url}",
+                        f"HTTP {response.status}"
+                    )
         except Exception as e:
             raise ImageProcessingError(f"Failed to download image: {e}")
 
@@ -55,110 +195,77 @@ class ImageProcessor:
             if image.mode != 'RGB':
                 image = image.convert('RGB')
 
-            # Create a semi-transparent overlay
-            overlay = Image.new('RGBA', image.size, (0, 0, 0, 0))
-            draw = ImageDraw.Draw(overlay)
-
-
             # Load font (use default if custom font fails)
             font_size_author = max(12, int(height * 0.02))
             font_size_title = max(14, int(height * 0.03))
             font_size_extra = max(10, int(height * 0.02))
 
             try:
-                if self.font_path and Path(self.font_path).exists():
-                    font_author = ImageFont.truetype(self.font_path, font_size_author)
-                    font_title = ImageFont.truetype(self.font_path, font_size_title)
-                    font_extra = ImageFont.truetype(self.font_path, font_size_extra)
+                if self.font_path:
+                    font_author = _get_font(self.font_path, font_size_author)
+                    font_title = _get_font(self.font_path, font_size_title)
+                    font_extra = _get_font(self.font_path, font_size_extra)
                 else:
                     font_author = ImageFont.load_default()
                     font_title = ImageFont.load_default()
                     font_extra = ImageFont.load_default()
             except OSError:
-                font = ImageFont.load_default()
+                font_author = font_title = font_extra = ImageFont.load_default()
 
-            color_author = (255, 239, 180, 255)
-            color_title = (255, 255, 255, 255)
-            color_extra = (90, 130, 200, 255)
+            color_author = (255, 239, 180)
+            color_title = (255, 255, 255)
+            color_extra = (90, 130, 200)
 
-            metadata = artwork.metadata.i18n.get('es')
-            line_author = metadata.author
-            line_title = metadata.title
-            line_extra = f"{metadata.style} · {artwork.metadata.century} ({artwork.metadata.year}) · {metadata.location}"
-
-            # Calculate text sizes using textbbox
-            def get_text_size(
-                text: str, font: Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]
-            ) -> tuple[int, int]:
-                bbox = draw.textbbox((0, 0), text, font=font)
-                return int(bbox[2] - bbox[0]), int(bbox[3] - bbox[1])
+            # Prefer the Spanish translation, falling back to the base metadata
+            metadata = artwork.metadata
+            translation = (metadata.i18n or {}).get('es') or ArtworkTranslation()
+            line_author = translation.author or metadata.author
+            line_title = translation.title or metadata.title
+            style = translation.style or metadata.style
+            location = translation.location or metadata.location
+            line_extra = f"{style} · {metadata.century} ({metadata.year}) · {location}"
 
             try:
-                text_w1, text_h1 = get_text_size(line_author, font_author)
-                text_w2, text_h2 = get_text_size(line_title, font_title)
-                text_w3, text_h3 = get_text_size(line_extra, font_extra)
+                text_w1, text_h1 = _text_size(line_author, font_author)
+                text_w2, text_h2 = _text_size(line_title, font_title)
+                text_w3, text_h3 = _text_size(line_extra, font_extra)
             except Exception:
                 # Fallback if text size calculation fails
                 text_w1, text_h1 = len(line_author) * 8, 16
                 text_w2, text_h2 = len(line_title) * 10, 20
                 text_w3, text_h3 = len(line_extra) * 7, 14
 
-            # Padding and spacing
-            padding_x = 40
-            padding_y = 35
-            spacing = 15
-            divider_height = 2
-            line_space = 25
-
-            box_width = max(text_w1, text_w2, text_w3) + 2 * padding_x
-            box_height = (
-                text_h1
-                + 2
-                + text_h2
-                + divider_height
-                + text_h3
-                + 2 * padding_y
-                + 2 * spacing
-                + line_space
+            box_x0, box_y0, box_width, box_height = _box_layout(
+                width, height, ((text_w1, text_h1), (text_w2, text_h2), (text_w3, text_h3))
             )
-
-            # Position box at bottom left with margins
-            margin_x, margin_y = 50, 50
-            box_x0 = margin_x
-            box_y0 = height - box_height - margin_y
             box_x1 = box_x0 + box_width
             box_y1 = box_y0 + box_height
 
-            # Ensure box is within image bounds
-            box_x0 = max(0, min(box_x0, width - box_width))
-            box_x1 = box_x0 + box_width
-            box_y0 = max(0, min(box_y0, height - box_height))
-            box_y1 = box_y0 + box_height
+            # Paste black through a box-sized blurred mask, rather than
+            # blurring a full-size layer
+            image.paste(
+                (0, 0, 0),
+                (
+                    box_x0 + _SHADOW_OFFSET - _SHADOW_PAD,
+                    box_y0 + _SHADOW_OFFSET - _SHADOW_PAD,
+                ),
+                _shadow_mask(box_width, box_height),
+            )
 
-            # Create shadow layer
-            shadow = Image.new("RGBA", image.size, (0, 0, 0, 0))
-            shadow_draw = ImageDraw.Draw(shadow)
-            shadow_offset = 10
-            shadow_box = [
-                box_x0 + shadow_offset,
-                box_y0 + shadow_offset,
-                box_x1 + shadow_offset,
-                box_y1 + shadow_offset,
-            ]
-            shadow_draw.rectangle(shadow_box, fill=(0, 0, 0, 180))
-            shadow = shadow.filter(ImageFilter.GaussianBlur(radius=10))
-
-            # Draw box background
-            draw.rectangle(
+            # Draw box background; only this fill needs alpha blending
+            ImageDraw.Draw(image, 'RGBA').rectangle(
                 [box_x0, box_y0, box_x1, box_y1],
                 fill=(0, 0, 0, 140),  # Semi-transparent background
                 outline=(255, 255, 255, 255),  # White border
                 width=1,  # Border thickness
             )
 
+            # Text and divider are opaque, so draw them in plain RGB
+            draw = ImageDraw.Draw(image)
+
             # Text coordinates
-            text_x = box_x0 + padding_x
-            text_y = box_y0 + padding_y
+            text_x = box_x0 + _PADDING_X
+            text_y = box_y0 + _PADDING_Y
 
             # Draw author (with shadow effect)
             shadow_offset = 2
@@ -166,88 +273,44 @@ class ImageProcessor:
                 (text_x + shadow_offset, text_y + shadow_offset),
                 line_author,
                 font=font_author,
-                fill=(0, 0, 0, 255),
+                fill=(0, 0, 0),
             )
             draw.text((text_x, text_y), line_author, font=font_author, fill=color_author)
 
 
             # Title
-            title_y = text_y + text_h1 + spacing
+            title_y = text_y + text_h1 + _SPACING
             draw.text(
                 (text_x + shadow_offset, title_y + shadow_offset),
                 line_title,
                 font=font_title,
-                fill=(0, 0, 0, 255),
+                fill=(0, 0, 0),
             )
             draw.text((text_x, title_y), line_title, font=font_title, fill=color_title)
 
             # Divider line
-            divider_y = title_y + text_h2 + line_space
+            divider_y = title_y + text_h2 + _LINE_SPACE
             draw.rectangle(
                 [
                     text_x,
                     divider_y,
                     text_x + max(text_w1, text_w2, text_w3),
-                    divider_y + divider_height,
+                    divider_y + _DIVIDER_HEIGHT,
                 ],
                 fill=color_title,
             )
 
             # Extra information
-            extra_y = divider_y + divider_height + spacing
+            extra_y = divider_y + _DIVIDER_HEIGHT + _SPACING
             draw.text(
                 (text_x + shadow_offset, extra_y + shadow_offset),
                 line_extra,
                 font=font_extra,
-                fill=(0, 0, 0, 255),
+                fill=(0, 0, 0),
             )
             draw.text((text_x, extra_y), line_extra, font=font_extra, fill=color_extra)
 
-
-            # Compose final image
-            try:
-                base = Image.alpha_composite(image, shadow)
-                final_image = Image.alpha_composite(base, overlay)
-            except Exception:
-                # Fallback if alpha composition fails
-                final_image = image
-
-            # Composite the overlay onto the original image
-            image_with_overlay = Image.alpha_composite(
-                image.convert('RGBA'), overlay
-            ).convert('RGB')
-
-            output = io.BytesIO()
-            image_with_overlay.save(output, format='JPEG', quality=95)
-            return output.getvalue()
-
-
-            # Calculate text dimensions and position
-            text_bbox = draw.textbbox((0, 0), metadata_text, font=font)
-            text_width = text_bbox[2] - text_bbox[0]
-            text_height = text_bbox[3] - text_bbox[1]
-
-            # Position at bottom-left with padding
-            padding = 20
-            x = padding
-            y = image.height - text_height - padding
-
-            # Draw semi-transparent background
-            bg_bbox = (x - 10, y - 10, x + text_width + 10, y + text_height + 10)
-            draw.rectangle(bg_bbox, fill=(0, 0, 0, 180))
-
-            # Draw text
-            draw.text((x, y), metadata_text, font=font, fill=(255, 255, 255, 255))
-
-            # Composite the overlay onto the original image
-            image_with_overlay = Image.alpha_composite(
-                image.convert('RGBA'), overlay
-            ).convert('RGB')
-
-            # Save to bytes
-            output = io.BytesIO()
-            image_with_overlay.save(output, format='JPEG', quality=95)
-            return output.getvalue()
+            return _encode_jpeg(image)
 
         except Exception as e:
             raise ImageProcessingError(f"Failed to embed metadata: {e}")
@@ -275,10 +338,7 @@ class ImageProcessor:
             # Calculate new dimensions
             image.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
 
-            # Save to bytes
-            output = io.BytesIO()
-            image.save(output, format='JPEG', quality=95)
-            return output.getvalue()
+            return _encode_jpeg(image)
 
         except Exception as e:
             raise ImageProcessingError(f"Failed to resize image: {e}")
@@ -325,8 +385,8 @@ class ImageProcessor:
         """Save image data to file."""
         try:
             filepath.parent.mkdir(parents=True, exist_ok=True)
-            with open(filepath, 'wb') as f:
-                f.write(image_data)
+            # Bytes are already JPEG encoded; write them as-is
+            filepath.write_bytes(image_data)
             self.logger.debug(f"Saved image to {filepath}")
         except Exception as e:
             raise ImageProcessingError(f"Failed to save image: {e}")
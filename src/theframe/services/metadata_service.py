@@ -5,16 +5,23 @@ import json
 import logging
 import os
 import random
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
-import httpx
-from ollama import chat
+import orjson
+from ollama import AsyncClient
 
 from ..core.exceptions import FileOperationError, MetadataError
 from ..core.models import (Artwork, ArtworkCollection, ArtworkMetadata,
                            ArtworkTranslation)
 
+# Keys stored alongside the metadata that belong to the Artwork itself
+_ARTWORK_KEYS = frozenset({'number', 'filename', 'bg_url'})
+
+# Supported image extensions, lowercase with the leading dot
+_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.webp', '.bmp', '.tiff'})
+
 
 class MetadataService:
     """Service for managing artwork metadata and collections."""
@@ -29,8 +36,7 @@ class MetadataService:
             if not path.exists():
                 raise FileOperationError(f"JSON file not found: {filepath}")
 
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = orjson.loads(path.read_bytes())
 
             collection = ArtworkCollection(name=path.stem)
 
@@ -49,11 +55,37 @@ class MetadataService:
 
             return collection
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise MetadataError(f"Invalid JSON format in {filepath}: {e}")
         except Exception as e:
             raise FileOperationError(f"Failed to load collection: {e}")
 
+    def load_random_artwork(self, filepath: str) -> Optional[Artwork]:
+        """Load a single random artwork from JSON file.
+
+        Only the chosen entry is validated into an Artwork, instead of
+        building the whole collection just to pick one.
+        """
+        try:
+            path = Path(filepath)
+            if not path.exists():
+                raise FileOperationError(f"JSON file not found: {filepath}")
+
+            data = orjson.loads(path.read_bytes())
+
+            if not data:
+                return None
+
+            # Skip to a random entry instead of copying the values to a list
+            entries = data.values() if isinstance(data, dict) else data
+            entry = next(islice(entries, random.randrange(len(data)), None))
+            return self._create_artwork_from_dict(entry)
+
+        except orjson.JSONDecodeError as e:
+            raise MetadataError(f"Invalid JSON format in {filepath}: {e}")
+        except Exception as e:
+            raise FileOperationError(f"Failed to load artwork: {e}")
+
     def save_collection_to_json(self, collection: ArtworkCollection, filepath: str) -> None:
         """Save artwork collection to JSON file."""
         try:
@@ -65,8 +97,7 @@ class MetadataService:
             for key, artwork in collection.artworks.items():
                 data[key] = self._artwork_to_dict(artwork)
 
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
             self.logger.info(f"Saved {collection.count()} artworks to {filepath}")
 
@@ -76,41 +107,33 @@ class MetadataService:
     def _create_artwork_from_dict(self, data: Dict[str, Any]) -> Artwork:
         """Create Artwork object from dictionary data."""
         try:
-            # Extract metadata
+            # Split artwork-level keys from metadata fields in a single pass
             metadata = ArtworkMetadata(
-                **data
+                **{k: v for k, v in data.items() if k not in _ARTWORK_KEYS}
             )
 
-            return Artwork(
-                number=data.get('number'),
-                filename=data.get('filename'),
-                bg_url=data.get('bg_url'),
-                metadata=metadata
-            )
+            return Artwork(number=data.get('number'), metadata=metadata)
         except Exception as e:
             raise MetadataError(f"Failed to create artwork from data: {e}")
 
     def _artwork_to_dict(self, artwork: Artwork) -> Dict[str, Any]:
         """Convert Artwork object to dictionary."""
+        metadata = artwork.metadata
         result = {
-            'author': artwork.metadata.author,
-            'title': artwork.metadata.title,
-            'style': artwork.metadata.style,
-            'year': artwork.metadata.year,
-            'century': artwork.metadata.century,
-            'location': artwork.metadata.location,
+            'author': metadata.author,
+            'title': metadata.title,
+            'style': metadata.style,
+            'year': metadata.year,
+            'century': metadata.century,
+            'location': metadata.location,
+            'wikipedia_url': metadata.wikipedia_url or None,
+            'number': artwork.number,
+            'filename': artwork.filename or None,
+            'bg_url': artwork.bg_url or None,
         }
 
-        if artwork.metadata.wikipedia_url:
-            result['wikipedia_url'] = artwork.metadata.wikipedia_url
-        if artwork.number is not None:
-            result['number'] = artwork.number
-        if artwork.filename:
-            result['filename'] = artwork.filename
-        if artwork.bg_url:
-            result['bg_url'] = artwork.bg_url
-
-        return result
+        # Drop optional fields that are not set
+        return {k: v for k, v in result.items() if v is not None}
 
     def generate_metadata_from_images(self, images_dir: str, base_url: str) -> List[Dict[str, Any]]:
         """Generate metadata for images in a directory."""
@@ -119,32 +142,18 @@ class MetadataService:
             if not images_path.exists():
                 raise FileOperationError(f"Images directory not found: {images_dir}")
 
+            # Strip the trailing slash once rather than for every file
+            base_url = base_url.rstrip('/')
+
             results = []
-            number = 1
 
             # Walk through directory structure (max 3 levels deep)
-            import os
-            for root, _, files in os.walk(images_path):
-                # Calculate relative path and depth
-                root_path = Path(root)
-                rel_path = root_path.relative_to(images_path)
-                levels = len(rel_path.parts) if str(rel_path) != '.' else 0
-
-                # Skip if too deep
-                if levels > 3:
-                    continue
-
-                # Process image files
-                for file in files:
-                    if self._is_image_file(file):
-                        filepath = root_path / file
-
-                        # Generate metadata from path and filename
-                        metadata = self._extract_metadata_from_path(
-                            filepath, images_path, number, base_url
-                        )
-                        results.append(metadata)
-                        number += 1
+            for entry, levels, rel_prefix in self._scan_image_files(images_dir):
+                # Generate metadata from path and filename
+                metadata = self._extract_metadata_from_path(
+                    entry.name, levels, rel_prefix + entry.name, len(results) + 1, base_url
+                )
+                results.append(metadata)
 
             self.logger.info(f"Generated metadata for {len(results)} images")
             return results
@@ -152,46 +161,77 @@ class MetadataService:
         except Exception as e:
             raise MetadataError(f"Failed to generate metadata: {e}")
 
+    def _scan_image_files(
+        self, directory: str, levels: Tuple[str, ...] = (), rel_prefix: str = ""
+    ) -> Iterator[Tuple[os.DirEntry, Tuple[str, ...], str]]:
+        """Yield image files at most 3 levels deep.
+
+        Each item is (entry, parent directory names, relative URL prefix);
+        both are built while descending, so no path is re-parsed per file.
+        Like a top-down os.walk, a directory's files come before those of
+        its subdirectories, and symlinked directories are not followed.
+        """
+        subdirs = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if len(levels) < 3 and not entry.is_symlink():
+                        subdirs.append(entry)
+                elif self._is_image_file(entry.name):
+                    yield entry, levels, rel_prefix
+
+        for entry in subdirs:
+            yield from self._scan_image_files(
+                entry.path, levels + (entry.name,), rel_prefix + entry.name + '/'
+            )
+
     def _is_image_file(self, filename: str) -> bool:
         """Check if file is a supported image format."""
-        extensions = {'.jpg', '.jpeg', '.png', '.webp', '.bmp', '.tiff'}
-        return Path(filename).suffix.lower() in extensions
+        # A leading dot marks a hidden file, not an extension
+        dot = filename.rfind('.')
+        return dot > 0 and filename[dot:].lower() in _IMAGE_EXTENSIONS
 
     def _extract_metadata_from_path(
-        self, filepath: Path, base_path: Path, number: int, base_url: str
+        self,
+        filename: str,
+        levels: Tuple[str, ...],
+        url_path: str,
+        number: int,
+        base_url: str,
     ) -> Dict[str, Any]:
-        """Extract metadata from file path structure."""
-        rel_path = filepath.relative_to(base_path)
-        parts = list(rel_path.parts)
+        """Extract metadata from file path structure.
+
+        ``levels`` are the directories between the images root and the
+        file; ``base_url`` is expected without a trailing slash.
+        """
+        # The file name without extension is the title in every layout
+        # (image files always have an extension past the first character)
+        stem = filename[:filename.rfind('.')]
 
         # Default values
         author = "Unknown"
-        title = filepath.stem
+        title = stem
         style = ""
 
         # Try to extract from path structure
-        if len(parts) >= 2:
-            # Format: author/title.jpg or style/author/title.jpg
-            if len(parts) == 2:
-                author = parts[0]
-                title = Path(parts[1]).stem
-            elif len(parts) >= 3:
-                style = parts[0]
-                author = parts[1]
-                title = Path(parts[-1]).stem
+        # Format: author/title.jpg or style/author/title.jpg
+        if len(levels) == 1:
+            author = levels[0]
+        elif len(levels) >= 2:
+            style = levels[0]
+            author = levels[1]
 
         # Clean up extracted data
         author = self._clean_name(author)
         title = self._clean_name(title)
         style = self._clean_name(style)
 
-        # Generate URL
-        url_path = str(rel_path).replace('\\', '/')
-        bg_url = f"{base_url.rstrip('/')}/{url_path}"
+        # Generate URL from the '/'-joined path built while scanning
+        bg_url = f"{base_url}/{url_path}"
 
         return {
             'number': number,
-            'filename': f"{number:04d}-{filepath.stem}.jpg",
+            'filename': f"{number:04d}-{stem}.jpg",
             'bg_url': bg_url,
             'author': author,
             'title': title,
@@ -216,37 +256,53 @@ class MetadataService:
         self,
         collection: ArtworkCollection,
         ai_model: str = "llama3.2:latest",
-        batch_size: int = 5
+        concurrency: int = 5
     ) -> ArtworkCollection:
         """Populate artwork metadata using AI."""
         artworks = list(collection.artworks.values())
         populated_collection = ArtworkCollection(name=f"{collection.name}_populated")
 
-        # Process in batches
-        for i in range(0, len(artworks), batch_size):
-            batch = artworks[i:i + batch_size]
-            self.logger.info(f"Processing batch {i//batch_size + 1} ({len(batch)} artworks)")
-
-            tasks = [self._populate_artwork_metadata(artwork, ai_model) for artwork in batch]
-            populated_artworks = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Add successfully populated artworks
-            for j, result in enumerate(populated_artworks):
+        # Bounded pool: a new artwork starts as soon as any slot frees up
+        semaphore = asyncio.Semaphore(concurrency)
+
+        # Results land in completion order but are kept in input order
+        populated: List[Artwork] = list(artworks)
+
+        async def worker(index: int, client: AsyncClient) -> Tuple[int, Union[Artwork, Exception]]:
+            async with semaphore:
+                try:
+                    return index, await self._populate_artwork_metadata(
+                        artworks[index], ai_model, client
+                    )
+                except Exception as e:
+                    return index, e
+
+        self.logger.info(
+            f"Processing {len(artworks)} artworks ({concurrency} concurrent requests)"
+        )
+        async with AsyncClient() as client:
+            tasks = [asyncio.create_task(worker(i, client)) for i in range(len(artworks))]
+
+            # Handle each artwork as soon as its response lands
+            for next_done in asyncio.as_completed(tasks):
+                index, result = await next_done
                 if isinstance(result, Exception):
-                    self.logger.error(f"Failed to populate {batch[j].display_name}: {result}")
                     # Keep original artwork
-                    original = batch[j]
-                    key = f"{original.number}" if original.number else original.safe_filename
-                    populated_collection.artworks[key] = original
+                    self.logger.error(
+                        f"Failed to populate {artworks[index].display_name}: {result}"
+                    )
                 else:
-                    # result is the populated Artwork
-                    populated_artwork = result
-                    key = f"{populated_artwork.number}" if populated_artwork.number else populated_artwork.safe_filename
-                    populated_collection.artworks[key] = populated_artwork
+                    populated[index] = result
+
+        for populated_artwork in populated:
+            key = f"{populated_artwork.number}" if populated_artwork.number else populated_artwork.safe_filename
+            populated_collection.artworks[key] = populated_artwork
 
         return populated_collection
 
-    async def _populate_artwork_metadata(self, artwork: Artwork, ai_model: str) -> Artwork:
+    async def _populate_artwork_metadata(
+        self, artwork: Artwork, ai_model: str, client: AsyncClient
+    ) -> Artwork:
         """Populate single artwork metadata using AI."""
         try:
             prompt = f"""
@@ -268,7 +324,7 @@ class MetadataService:
             Format as JSON with keys: author, title, style, year, century, location, description
             """
 
-            response = chat(model=ai_model, messages=[{'role': 'user', 'content': prompt}])
+            response = await client.chat(model=ai_model, messages=[{'role': 'user', 'content': prompt}])
 
             # Parse AI response
             ai_data = self._parse_ai_response(response.message.content)
@@ -346,24 +402,20 @@ class MetadataService:
 
     def get_random_artwork(self, collection: ArtworkCollection) -> Optional[Artwork]:
         """Get a random artwork from the collection."""
-        if not collection.artworks:
-            return None
+        # Reservoir sample of one: single pass, no candidate list
+        selected = None
+        candidates = 0
+        for artwork in collection.artworks.values():
+            if artwork.bg_url is not None:
+                candidates += 1
+                if random.randrange(candidates) == 0:
+                    selected = artwork
 
-        return random.choice([v for v in collection.artworks.values() if v.bg_url is not None])
+        return selected
 
     def find_duplicates(self, collection: ArtworkCollection) -> List[Artwork]:
         """Find duplicate artworks in collection."""
-        seen = {}
-        duplicates = []
-
-        for artwork in collection.artworks.values():
-            key = f"{artwork.metadata.title}|{artwork.metadata.author}"
-
-            if key in seen:
-                duplicates.append(artwork)
-            else:
-                seen[key] = artwork
-
+        _, duplicates = self.scan(collection)
         return duplicates
 
     def check_images(self, collection: ArtworkCollection) -> List[Artwork]:
@@ -386,25 +438,44 @@ class MetadataService:
 
     def validate_collection(self, collection: ArtworkCollection) -> List[str]:
         """Validate collection and return list of issues."""
-        issues = []
+        issues, _ = self.scan(collection)
+        return issues
+
+    def scan(self, collection: ArtworkCollection) -> Tuple[List[str], List[Artwork]]:
+        """Validate collection and find duplicates in a single pass."""
+        seen: Dict[Tuple[str, str], Artwork] = {}
         numbers = set()
+        issues = []
+        duplicates = []
 
         for key, artwork in collection.artworks.items():
+            metadata = artwork.metadata
+            title = metadata.title
+            author = metadata.author
+
+            # Check for duplicate artworks, ignoring case and stray whitespace
+            duplicate_key = (title.lower().strip(), author.lower().strip())
+            if duplicate_key in seen:
+                duplicates.append(artwork)
+            else:
+                seen[duplicate_key] = artwork
+
             # Check for missing data
-            if not artwork.metadata.title or artwork.metadata.title == 'Untitled':
+            if not title or title == 'Untitled':
                 issues.append(f"Missing title for artwork {key}")
 
-            if not artwork.metadata.author or artwork.metadata.author == 'Unknown':
+            if not author or author == 'Unknown':
                 issues.append(f"Missing author for artwork {key}")
 
             if not artwork.bg_url:
                 issues.append(f"Missing image URL for artwork {key}")
 
             # Check for duplicate numbers
-            if artwork.number:
-                if artwork.number in numbers:
-                    issues.append(f"Duplicate number {artwork.number} for artwork {key}")
-                numbers.add(artwork.number)
+            number = artwork.number
+            if number:
+                if number in numbers:
+                    issues.append(f"Duplicate number {number} for artwork {key}")
+                numbers.add(number)
 
         # Check for missing numbers in sequence
         if numbers:
@@ -413,5 +484,4 @@ class MetadataService:
             for num in missing:
                 issues.append(f"Missing artwork number {num}")
 
-        return issues
-
+        return issues, duplicates
@@ -1,14 +1,18 @@
 """TV communication service for Samsung Frame TV."""
 
+import socket
 from typing import Dict, Optional
 
-from ping3 import ping
 from samsungtvws import SamsungTVWS
+from samsungtvws.art import SamsungTVArt
 
 from ..core.exceptions import TVConnectionError
 from ..core.logging import get_logger
 from ..core.models import TVDevice
 
+# Port used by the SamsungTVWS secure websocket API
+TV_PORT = 8002
+
 
 class TVService:
     """Service for communicating with Samsung Frame TV."""
@@ -17,6 +21,7 @@ class TVService:
         self.device = device
         self.logger = get_logger(__name__)
         self._tv_connection: Optional[SamsungTVWS] = None
+        self._art_connection: Optional[SamsungTVArt] = None
 
     @property
     def tv(self) -> SamsungTVWS:
@@ -24,21 +29,38 @@ class TVService:
         if self._tv_connection is None:
             self._tv_connection = SamsungTVWS(
                 host=self.device.ip,
-                port=8002,
+                port=TV_PORT,
                 token=self.device.token,
                 timeout=10
             )
 
         return self._tv_connection
 
-    def test_connection(self) -> bool:
-        """Test connection to the TV."""
+    @property
+    def art(self) -> SamsungTVArt:
+        """Get or create the art mode API handle."""
+        if self._art_connection is None:
+            self._art_connection = self.tv.art()
+
+        return self._art_connection
+
+    def test_connection(self, quick: bool = True) -> bool:
+        """Test connection to the TV.
+
+        A TCP connect to the websocket port is always tried first; unless
+        ``quick`` is set, the REST device info endpoint is queried as well.
+        """
         try:
-            delay = ping(self.device.ip)
-            if delay is None:
-                self.logger.debug("TV not online", tv_ip=self.device.ip, error=str(e))
-                return False
+            with socket.create_connection((self.device.ip, TV_PORT), timeout=1):
+                pass
+        except OSError as e:
+            self.logger.debug("TV not online", tv_ip=self.device.ip, error=str(e))
+            return False
 
+        if quick:
+            return True
+
+        try:
             # Try to get device info as a connection test
             info = self.tv.rest_device_info()
             self.logger.debug("Connected to TV", device_info=info, tv_ip=self.device.ip)
@@ -47,10 +69,16 @@ class TVService:
             self.logger.error("Failed to connect to TV", tv_ip=self.device.ip, error=str(e))
             return False
 
-    def upload_image(self, image_data: bytes, filename: str) -> bool:
-        """Upload image to Samsung Frame TV."""
+    def upload_image(
+        self, image_data: bytes, filename: str, check_connection: bool = True
+    ) -> bool:
+        """Upload image to Samsung Frame TV.
+
+        Set ``check_connection`` to False when the caller has already
+        probed the TV.
+        """
         try:
-            if not self.test_connection():
+            if check_connection and not self.test_connection():
                 raise TVConnectionError("Cannot connect to TV")
 
             self.logger.info("Uploading image to Samsung Frame TV",
@@ -59,8 +87,9 @@ class TVService:
                            image_size=len(image_data))
 
             # Upload the image
-            uploaded_id = self.tv.art().upload(image_data, file_type="JPEG", matte="none")
-            self.tv.art().select_image(uploaded_id, show=self.tv.art().get_artmode() == "on")
+            artmode_on = self.art.get_artmode() == "on"
+            uploaded_id = self.art.upload(image_data, file_type="JPEG", matte="none")
+            self.art.select_image(uploaded_id, show=artmode_on)
             self.logger.info("Successfully uploaded image", filename=filename)
             return True
         except Exception as e:
@@ -77,7 +106,7 @@ class TVService:
     def get_art_mode_status(self) -> Dict:
         """Get current art mode status."""
         try:
-            return self.tv.art().get_current()
+            return self.art.get_current()
         except Exception as e:
             self.logger.warning("Failed to get art mode status", error=str(e))
             return {}
@@ -85,15 +114,13 @@ class TVService:
     def set_art_mode(self, artwork_id: Optional[str] = None) -> bool:
         """Set TV to art mode, optionally with specific artwork."""
         try:
-            art_api = self.tv.art()
-
             if artwork_id:
                 # Set specific artwork
-                result = art_api.select_image(artwork_id)
+                result = self.art.select_image(artwork_id)
                 self.logger.info("Set artwork", artwork_id=artwork_id)
             else:
                 # Just enable art mode
-                result = art_api.set_current("on")
+                result = self.art.set_current("on")
                 self.logger.info("Enabled art mode")
 
             return result
@@ -107,7 +134,7 @@ class TVService:
     def get_artwork_list(self) -> list:
         """Get list of available artworks on TV."""
         try:
-            return self.tv.art().get_list()
+            return self.art.get_list()
         except Exception as e:
             self.logger.warning("Failed to get artwork list", error=str(e))
             return []
@@ -115,7 +142,7 @@ class TVService:
     def delete_artwork(self, artwork_id: str) -> bool:
         """Delete artwork from TV."""
         try:
-            result = self.tv.art().delete(artwork_id)
+            result = self.art.delete(artwork_id)
             if result:
                 self.logger.info("Deleted artwork", artwork_id=artwork_id)
             return result